@@ -5,14 +5,38 @@ import json
 import re
 import time
 import difflib
+import hashlib
 import logging
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict
-import urllib.request
+import queue
+import threading
+from collections import defaultdict
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # lxml is optional too; fall back to BeautifulSoup's html.parser
+    etree = lxml_html = None
+
+try:
+    from rapidfuzz import fuzz, process, utils
+except ImportError:  # Not every Kodi platform ships rapidfuzz; fall back to difflib
+    fuzz = process = utils = None
+
+try:
+    import orjson
+except ImportError:  # Same for orjson; fall back to the json module
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,6 +44,111 @@ logger = logging.getLogger(__name__)
 # Constants
 URL_CANAL_JSON = "https://raw.githubusercontent.com/ElBarcoDeSabeT/El-barco-de-sabeT-Online/main/canales.json"
 PROXIES_URL = "https://api.proxyscrape.com/v4/free-proxy-list/get?request=display_proxies&proxy_format=protocolipport&format=json"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/58.0.3029.110 Safari/537.3"
+)
+PROXY_RACE_SIZE = 20  # Proxies probed concurrently per batch
+PROXY_TIMEOUT = (3.05, 5)  # Connect and read timeouts, in seconds, for proxy probes
+CHANNELS_CACHE_TTL = 24 * 60 * 60  # Seconds
+TV_PROGRAMS_CACHE_TTL = 60 * 60  # Seconds
+ACESTREAM_LINK_RE = re.compile(r'<a href="(acestream://[^"]+)"[^>]*>(.*?)</a>')
+
+
+def _read_json_file(path: str) -> Any:
+    """Read and parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json_file(path: str, data: Any, indent: bool = False):
+    """Serialize data to a JSON file, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4 if indent else None)
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """Build a relative XPath matching ``tag`` elements that have ``class_name`` among their classes."""
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Tag and class of the time, event name, channel and sport of a daily event
+EVENT_FIELDS = (
+    ("strong", "dailyhour"),
+    ("h4", "dailyteams"),
+    ("span", "dailychannel"),
+    ("span", "dailyday"),
+)
+
+if etree is not None:
+    # Compiled once at import time
+    DAY_SECTIONS_XPATH = etree.XPath(_class_xpath("li", "content-item"))
+    DAY_TITLE_XPATH = etree.XPath(f"({_class_xpath('span', 'title-section-widget')})[1]")
+    DAILY_EVENTS_XPATH = etree.XPath(_class_xpath("li", "dailyevent"))
+    EVENT_FIELDS_XPATHS = tuple(
+        etree.XPath(f"({_class_xpath(tag, class_name)})[1]")
+        for tag, class_name in EVENT_FIELDS
+    )
+    SCHEDULE_PARSE_ERRORS: Tuple[type, ...] = (etree.ParserError,)
+else:
+    SCHEDULE_PARSE_ERRORS = ()
+
+
+def _first_text(xpath: "etree.XPath", element, default: Optional[str] = None) -> Optional[str]:
+    """Return the stripped text of the first node matched by xpath, or default if none matches."""
+    nodes = xpath(element)
+    return nodes[0].text_content().strip() if nodes else default
+
+
+def _iter_schedule_lxml(
+    content: bytes, encoding: str
+) -> Iterator[Tuple[str, str, str, str, str]]:
+    """Yield (day, time, event, channel, sport) rows of the TV schedule page using lxml."""
+    root = lxml_html.fromstring(content, parser=lxml_html.HTMLParser(encoding=encoding))
+    for day_section in DAY_SECTIONS_XPATH(root)[1:]:
+        day = _first_text(DAY_TITLE_XPATH, day_section)
+        if day is None:
+            continue
+        for event in DAILY_EVENTS_XPATH(day_section):
+            yield (day, *(
+                _first_text(field_xpath, event, "N/A")
+                for field_xpath in EVENT_FIELDS_XPATHS
+            ))
+
+
+def _iter_schedule_bs4(content: bytes) -> Iterator[Tuple[str, str, str, str, str]]:
+    """Yield (day, time, event, channel, sport) rows of the TV schedule page using BeautifulSoup."""
+    soup = BeautifulSoup(content, "html.parser")
+    for day_section in soup.find_all("li", class_="content-item")[1:]:
+        day_span = day_section.find("span", class_="title-section-widget")
+        if not day_span:
+            continue
+        day = day_span.text.strip()
+        for event in day_section.find_all("li", class_="dailyevent"):
+            tags = (event.find(tag, class_=class_name) for tag, class_name in EVENT_FIELDS)
+            yield (day, *(tag.text.strip() if tag else "N/A" for tag in tags))
+
+
+def normalize_channel_name(name: str) -> str:
+    """Normalize a channel name for comparison.
+
+    Without rapidfuzz the name is returned unchanged, since difflib compares
+    names case- and whitespace-sensitively.
+    """
+    if utils is not None:
+        return utils.default_process(name)
+    return name
 
 
 @dataclass
@@ -39,20 +168,86 @@ class Event:
 
 
 class CoreAddon:
-    def __init__(self, addon_dir: str, cache_file: str):
+    def __init__(self, addon_dir: str, cache_file: str, lazy: bool = False):
         self.addon_dir = addon_dir
         self.cache_file = cache_file
-        self.channels: List[Channel] = self.fetch_channels(URL_CANAL_JSON)
-        self.tv_programs: List[Event] = self.get_tv_programs()
+        self._session = self._create_session(Retry(total=2, backoff_factor=0.3))
+        # Page probes (direct or through a proxy) fail fast instead of retrying,
+        # so a blocked site or dead proxy hands over to the next attempt quickly
+        self._probe_session = self._create_session(0)
+        if not lazy:
+            self.load_sources()
+
+    @staticmethod
+    def _create_session(max_retries: Union[Retry, int]) -> requests.Session:
+        """Create an HTTP session with connection pooling and the given retry policy."""
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=max_retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @cached_property
+    def channels(self) -> List[Channel]:
+        """Channel list, fetched on first access."""
+        return self.fetch_channels(URL_CANAL_JSON)
+
+    @cached_property
+    def tv_programs(self) -> List[Event]:
+        """TV programs, fetched on first access."""
+        return self.get_tv_programs()
+
+    def load_sources(self) -> Tuple[List[Channel], List[Event]]:
+        """Load the channel list and TV programs eagerly, fetching both concurrently."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            channels = executor.submit(lambda: self.channels)
+            tv_programs = executor.submit(lambda: self.tv_programs)
+            return channels.result(), tv_programs.result()
+
+    def _url_cache_path(self, url: str) -> str:
+        """Return the on-disk cache path for the given URL."""
+        digest = hashlib.md5(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.addon_dir, f"cache_{digest}.json")
+
+    def _load_url_cache(self, url: str, ttl: int) -> Optional[Any]:
+        """Load cached data for a URL, or None if missing or older than ttl seconds."""
+        path = self._url_cache_path(url)
+        try:
+            if os.path.getmtime(path) < time.time() - ttl:
+                return None
+            return _read_json_file(path)
+        except (IOError, json.JSONDecodeError):
+            return None
+
+    def _save_url_cache(self, url: str, data: Any):
+        """Save data fetched from a URL to its on-disk cache."""
+        path = self._url_cache_path(url)
+        try:
+            _write_json_file(path, data)
+        except IOError as e:
+            logger.error(f"Failed to save cache for {url} to {path}: {e}")
 
     def fetch_channels(self, url: str) -> List[Channel]:
-        """Fetch channel list from a remote JSON URL."""
+        """Fetch channel list from a remote JSON URL, using the on-disk cache when fresh."""
+        cached = self._load_url_cache(url, CHANNELS_CACHE_TTL)
+        if cached is not None:
+            channels = [Channel(**channel) for channel in cached]
+            logger.info(f"Loaded {len(channels)} channels from cache.")
+            return channels
+
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
             channels_data = response.json()
             channels = [Channel(**channel) for channel in channels_data]
             logger.info(f"Fetched {len(channels)} channels.")
+            if channels:
+                self._save_url_cache(url, channels_data)
             return channels
         except requests.RequestException as e:
             logger.error(f"Failed to load channels from {url}: {e}")
@@ -61,68 +256,102 @@ class CoreAddon:
     def get_tv_programs(
         self, url: str = "https://www.marca.com/programacion-tv.html"
     ) -> List[Event]:
-        """Retrieve TV programs from the specified URL, ensuring no duplicates."""
+        """Retrieve TV programs from the specified URL, ensuring no duplicates.
+
+        Results are cached on disk for TV_PROGRAMS_CACHE_TTL seconds.
+        """
+        cached = self._load_url_cache(url, TV_PROGRAMS_CACHE_TTL)
+        if cached is not None:
+            events_data = [Event(**event) for event in cached]
+            logger.info(f"Loaded {len(events_data)} TV programs from cache.")
+            return events_data
+
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            day_sections = soup.find_all("li", class_="content-item")
-            events_data = []
-            seen_events = set()
-            day_sections = day_sections[1:]
-
-            for day_section in day_sections:
-                day_span = day_section.find("span", class_="title-section-widget")
-                if not day_span:
-                    continue
-                day = day_span.text.strip()
-
-                events = day_section.find_all("li", class_="dailyevent")
-                for event in events:
-                    time_tag = event.find("strong", class_="dailyhour")
-                    event_name_tag = event.find("h4", class_="dailyteams")
-                    channel_tag = event.find("span", class_="dailychannel")
-                    sport_tag = event.find("span", class_="dailyday")
-
-                    time_text = time_tag.text.strip() if time_tag else "N/A"
-                    event_name = (
-                        event_name_tag.text.strip() if event_name_tag else "N/A"
+            if lxml_html is not None:
+                # libxml2 falls back to Latin-1 without a <meta charset>; requests
+                # also reports ISO-8859-1 for text/html without a charset, so only
+                # trust the header when it names one explicitly
+                content_type = response.headers.get("Content-Type", "").lower()
+                encoding = response.encoding if "charset=" in content_type else "utf-8"
+                rows = _iter_schedule_lxml(response.content, encoding)
+            else:
+                rows = _iter_schedule_bs4(response.content)
+
+            events_by_id: Dict[Tuple[str, str, str, str], Event] = {}
+            for day, time_text, event_name, channel, sport in rows:
+                event_id = (day, time_text, event_name, channel)
+                if event_id not in events_by_id:
+                    events_by_id[event_id] = Event(
+                        day, time_text, event_name, channel, sport
                     )
-                    channel = channel_tag.text.strip() if channel_tag else "N/A"
-                    sport = sport_tag.text.strip() if sport_tag else "N/A"
-
-                    event_id = (day, time_text, event_name, channel)
-                    if event_id not in seen_events:
-                        events_data.append(
-                            Event(day, time_text, event_name, channel, sport)
-                        )
-                        seen_events.add(event_id)
 
+            events_data = list(events_by_id.values())
             logger.info(f"Fetched {len(events_data)} unique TV programs.")
-            print(events_data)
+            # An empty schedule likely means a layout change or a bad page; don't
+            # serve it from disk for the next hour
+            if events_data:
+                self._save_url_cache(url, [asdict(event) for event in events_data])
             return events_data
-        except requests.RequestException as e:
+        except (requests.RequestException, *SCHEDULE_PARSE_ERRORS) as e:
             logger.error(f"Failed to retrieve TV programs from {url}: {e}")
             return []
 
     def find_closest_channel(
-        self, channel_name: str, channels_names: List[str]
+        self,
+        channel_name: str,
+        channels_names: List[str],
+        normalized_names: Optional[List[str]] = None,
+        exact_names: Optional[Dict[str, str]] = None,
     ) -> Optional[str]:
-        """Find the closest matching channel name using difflib."""
-        closest_matches = difflib.get_close_matches(
-            channel_name, [c for c in channels_names], n=1, cutoff=0.5
-        )
-        return closest_matches[0] if closest_matches else None
+        """Find the closest matching channel name using rapidfuzz, or difflib if unavailable.
+
+        ``normalized_names`` may hold ``channels_names`` already passed through
+        ``normalize_channel_name`` so repeated lookups skip re-normalizing, and
+        ``exact_names`` may map those normalized names back to the original ones
+        so exact matches skip fuzzy scoring altogether.
+        """
+        normalized_name = normalize_channel_name(channel_name)
+        if exact_names is not None and normalized_name in exact_names:
+            return exact_names[normalized_name]
+
+        if process is not None:
+            if normalized_names is None:
+                normalized_names = [normalize_channel_name(c) for c in channels_names]
+            # Plain ratio like difflib; WRatio's partial/token scorers attach
+            # unrelated channels. 60 rejects near misses such as "Teledeporte"
+            # vs "Movistar Deportes" (57) while real matches score 80+
+            match = process.extractOne(
+                normalized_name,
+                normalized_names,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=60,
+            )
+            return channels_names[match[2]] if match else None
+
+        # Same scoring as difflib.get_close_matches(n=1, cutoff=0.5), keeping only
+        # the best candidate instead of collecting every one above the cutoff
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(channel_name)
+        best = None
+        for candidate in channels_names:
+            matcher.set_seq1(candidate)
+            if matcher.real_quick_ratio() < 0.5 or matcher.quick_ratio() < 0.5:
+                continue
+            score = matcher.ratio()
+            if score >= 0.5 and (best is None or (score, candidate) > best):
+                best = (score, candidate)
+        return best[1] if best else None
 
     def load_cache(self) -> Dict:
         """Load cache data from the cache file."""
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    cache = json.load(f)
-                    logger.info("Cache loaded successfully.")
-                    return cache
+                cache = _read_json_file(self.cache_file)
+                logger.info("Cache loaded successfully.")
+                return cache
             except (IOError, json.JSONDecodeError) as e:
                 logger.error(f"Failed to load cache: {e}")
         return {}
@@ -130,9 +359,8 @@ class CoreAddon:
     def save_cache(self, data: Dict):
         """Save data to the cache file."""
         try:
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-                logger.info("Cache saved successfully.")
+            _write_json_file(self.cache_file, data, indent=True)
+            logger.info("Cache saved successfully.")
         except IOError as e:
             logger.error(f"Failed to save cache to {self.cache_file}: {e}")
 
@@ -143,25 +371,27 @@ class CoreAddon:
             dialog_interface.notification("Canceled", "M3U export canceled.")
             return
 
+        # Reversed so the first channel wins on duplicate names, as before
+        channel_by_name = {c.nombre.lower(): c for c in reversed(self.channels)}
+
+        # M3U header with EPG URLs
+        lines = [
+            '#EXTM3U url-tvg="https://raw.githubusercontent.com/davidmuma/EPG_dobleM/master/guiatv.xml, https://raw.githubusercontent.com/Icastresana/lista1/main/epg.xml"\n'
+        ]
+        for title, link in zip(titles, links):
+            # Extract channel name for matching
+            channel_name = " ".join(title.split()[:-1]).strip().lower()
+            channel = channel_by_name.get(channel_name)
+            if channel:
+                lines.append(
+                    f'#EXTINF:-1 tvg-id="{channel.tvg_id}" tvg-logo="{channel.logo}",{title}\n{link}\n'
+                )
+            else:
+                lines.append(f"#EXTINF:-1,{title}\n{link}\n")
+
         try:
             with open(m3u_path, "w", encoding="utf-8") as f:
-                # Write M3U header with EPG URLs
-                f.write(
-                    '#EXTM3U url-tvg="https://raw.githubusercontent.com/davidmuma/EPG_dobleM/master/guiatv.xml, https://raw.githubusercontent.com/Icastresana/lista1/main/epg.xml"\n'
-                )
-                for title, link in zip(titles, links):
-                    # Extract channel name for matching
-                    channel_name = " ".join(title.split()[:-1]).strip().lower()
-                    channel = next(
-                        (c for c in self.channels if c.nombre.lower() == channel_name),
-                        None,
-                    )
-                    if channel:
-                        f.write(
-                            f'#EXTINF:-1 tvg-id="{channel.tvg_id}" tvg-logo="{channel.logo}",{title}\n{link}\n'
-                        )
-                    else:
-                        f.write(f"#EXTINF:-1,{title}\n{link}\n")
+                f.write("".join(lines))
             dialog_interface.notification("Success", f"M3U list exported to {m3u_path}")
             logger.info(f"M3U exported successfully to {m3u_path}")
         except IOError as e:
@@ -171,39 +401,28 @@ class CoreAddon:
     def fetch_proxies(self, url: str) -> List[Dict]:
         """Fetch a list of proxies from the given URL."""
         try:
-            with urllib.request.urlopen(url) as response:
-                proxies_json = json.loads(response.read().decode('utf-8'))
-                return proxies_json['proxies']  # Assuming the JSON has a 'proxies' key
+            response = self._session.get(url, timeout=10)
+            response.raise_for_status()
+            return response.json()['proxies']  # Assuming the JSON has a 'proxies' key
         except Exception as e:
             logger.error(f"Failed to load proxies from {url}: {e}")
             return []
 
-    def filter_asian_proxies(self, proxies: List[Dict]) -> List[str]:
-        """Filter proxies to include only those from Asia."""
-        proxies_asia = []
+    def _iter_asian_proxies(self, proxies: List[Dict]) -> Iterator[str]:
+        """Yield the proxies located in Asia."""
         for proxy in proxies:
             ip_data = proxy.get('ip_data')
             if ip_data and ip_data.get('continentCode') == 'AS':
-                proxies_asia.append(proxy['proxy'])
-        return proxies_asia
+                yield proxy['proxy']
 
     def get_web_content(self, url: str, proxy: Optional[str] = None) -> Optional[str]:
         """Fetch web content using an optional proxy."""
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/58.0.3029.110 Safari/537.3"
-            )
-        }
         try:
-            if proxy:
-                proxies = {"http": proxy, "https": proxy}
-                response = requests.get(
-                    url, headers=headers, proxies=proxies, timeout=10
-                )
-            else:
-                response = requests.get(url, headers=headers, timeout=10)
+            response = self._probe_session.get(
+                url,
+                proxies={"http": proxy, "https": proxy} if proxy else None,
+                timeout=PROXY_TIMEOUT if proxy else 10,
+            )
             response.raise_for_status()
             logger.info(
                 f"Fetched content from {url} using {'proxy ' + proxy if proxy else 'no proxy'}."
@@ -213,25 +432,71 @@ class CoreAddon:
             logger.warning(f"Failed to fetch {url} with proxy {proxy}: {e}")
             return None
 
+    def _race_proxies(self, url: str, proxies: Iterable[str]) -> Optional[str]:
+        """Fetch web content through batches of proxies concurrently, returning the first success."""
+        proxies = iter(proxies)
+        while True:
+            batch = list(islice(proxies, PROXY_RACE_SIZE))
+            if not batch:
+                return None
+            results: "queue.Queue[Tuple[str, Optional[str]]]" = queue.Queue()
+
+            def probe(proxy: str, results: "queue.Queue[Tuple[str, Optional[str]]]"):
+                content = None
+                try:
+                    content = self.get_web_content(url, proxy)
+                finally:
+                    # Always report back so the loop below never blocks forever
+                    results.put((proxy, content))
+
+            for proxy in batch:
+                # Losing probes are not cancelled and Kodi may wait for them before
+                # tearing down the interpreter, so PROXY_TIMEOUT is what bounds them
+                # (its read timeout applies per read, not to the whole request)
+                threading.Thread(
+                    target=probe, args=(proxy, results), daemon=True
+                ).start()
+            for _ in batch:
+                proxy, content = results.get()
+                if content:
+                    logger.info(f"Successfully fetched content using proxy: {proxy}")
+                    return content
+
     def extract_program_links(self, html: str) -> Tuple[List[str], List[str]]:
         """Extract program links and titles from the HTML content."""
         enlaces = {}
-        titulos = []
 
-        patrones = re.findall(r'<a href="(acestream://[^"]+)"[^>]*>(.*?)</a>', html)
-        for enlace, titulo in patrones:
+        for match in ACESTREAM_LINK_RE.finditer(html):
+            enlace, titulo = match.groups()
             nuevo_enlace = enlace.replace(
                 "acestream://", "plugin://script.module.horus?action=play&id="
             )
-            titulos.append(titulo.strip())
             enlaces[titulo.strip()] = nuevo_enlace
 
+        # Group the titles by their name without the quality suffix
+        titles_by_base: Dict[str, List[str]] = defaultdict(list)
+        for titulo in enlaces:
+            titles_by_base[titulo.replace("720", "").replace("1080", "")].append(titulo)
+
         new_enlaces = []
         new_titulos = []
         last_date = None
-        print(titulos)
-        titulos_without_quality = [title.replace("720", "").replace("1080", "") for title in titulos]
+        titulos_without_quality = list(titles_by_base)
+        normalized_titles = [normalize_channel_name(title) for title in titulos_without_quality]
+        exact_titles = {}
+        for title, normalized_title in zip(titulos_without_quality, normalized_titles):
+            base = exact_titles.setdefault(normalized_title, title)
+            if base != title:
+                # Bases that normalize alike (e.g. "DAZN 1 " from "DAZN 1 1080" and
+                # a bare "DAZN 1") are one channel: merge their variants
+                titles_by_base[base].extend(titles_by_base[title])
+        # List the 720 variant first, then 1080, then the bare title, as before
+        for variants in titles_by_base.values():
+            variants.sort(
+                key=lambda t: 0 if t.endswith("720") else 1 if t.endswith("1080") else 2
+            )
         for program in self.tv_programs:
+            prefix = f"{program.sport} {program.time} {program.event}"
             if program.day != last_date:
                 last_date = program.day
                 new_enlaces.append(f"# {program.day}")  # Add the date as a comment
@@ -240,28 +505,19 @@ class CoreAddon:
                 closest_tvg_id = "M.Plus 1080"
             else:
                 closest_tvg_id = self.find_closest_channel(
-                    program.channel, titulos_without_quality
+                    program.channel, titulos_without_quality, normalized_titles, exact_titles
                 )
-                print(closest_tvg_id)
-            found = False
             if closest_tvg_id:
-                for quality in ["720", "1080"]:
-                    if f"{closest_tvg_id}{quality}" in titulos:
-                        found = True
-                        new_closest_tvg_id = f"{closest_tvg_id}{quality}"  
-                        new_enlaces.append(enlaces[new_closest_tvg_id])
-                        new_titulos.append(
-                            f"{program.sport} {program.time} {program.event} ({new_closest_tvg_id})"
-                        )
-                if closest_tvg_id in titulos:
-                    found = True
-                    new_enlaces.append(enlaces[closest_tvg_id])
-                    new_titulos.append(
-                        f"{program.sport} {program.time} {program.event} ({closest_tvg_id})"
-                    )
-                if not found:
+                variants = titles_by_base.get(closest_tvg_id)
+                if not variants and closest_tvg_id in enlaces:
+                    # Fixed mappings such as Movistar Plus+ name a full title
+                    variants = [closest_tvg_id]
+                for variant in variants or []:
+                    new_enlaces.append(enlaces[variant])
+                    new_titulos.append(f"{prefix} ({variant})")
+                if not variants:
                     new_enlaces.append(f"# No matching channel for {program.event}, this was the channel: {program.channel}")
-                    new_titulos.append(f"{program.sport} {program.time} {program.event} - No match for {program.channel}")
+                    new_titulos.append(f"{prefix} - No match for {program.channel}")
 
         logger.info("Extracted program links.")
         return new_enlaces, new_titulos
@@ -271,8 +527,8 @@ class CoreAddon:
         enlaces = []
         titulos = []
 
-        patrones = re.findall(r'<a href="(acestream://[^"]+)"[^>]*>(.*?)</a>', html)
-        for enlace, titulo in patrones:
+        for match in ACESTREAM_LINK_RE.finditer(html):
+            enlace, titulo = match.groups()
             nuevo_enlace = enlace.replace(
                 "acestream://", "plugin://script.module.horus?action=play&id="
             )
@@ -293,15 +549,6 @@ class CoreAddon:
             if selection == 0
             else "https://viendoelfutbolporlaface.pages.dev/"
         )
-        proxies = self.fetch_proxies(PROXIES_URL)
-
-        if not proxies:
-            logger.error("No proxies available.")
-            if dialog_interface:
-                dialog_interface.notification("Error", "No proxies found.")
-            return {}
-
-        asian_proxies = self.filter_asian_proxies(proxies)
 
         # Attempt to fetch content without proxy
         if dialog_interface:
@@ -311,19 +558,22 @@ class CoreAddon:
         content = self.get_web_content(url_selected)
 
         if not content:
-            # Attempt with proxies
+            # Attempt with proxies, only fetched when the direct connection fails
+            proxies = self.fetch_proxies(PROXIES_URL)
+            if not proxies:
+                logger.error("No proxies available.")
+                if dialog_interface:
+                    dialog_interface.notification("Error", "No proxies found.")
+                return {}
+
             if dialog_interface:
                 dialog_interface.notification(
                     "Proxy", "Attempting to connect using proxies"
                 )
-            for proxy in asian_proxies:
-                if dialog_interface:
-                    dialog_interface.notification("Proxy", f"Trying proxy: {proxy}")
-                content = self.get_web_content(url_selected, proxy)
-                if content:
-                    logger.info(f"Successfully fetched content using proxy: {proxy}")
-                    break
-            else:
+            content = self._race_proxies(
+                url_selected, self._iter_asian_proxies(proxies)
+            )
+            if not content:
                 if dialog_interface:
                     dialog_interface.notification(
                         "Error", "Failed to retrieve content with all proxies."
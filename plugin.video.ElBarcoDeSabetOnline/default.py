@@ -35,7 +35,9 @@ class KodiAddonWrapper:
         self.plugin_url = PLUGIN_URL
         self.addon_dir = ADDON_DIR
         self.cache_file = CACHE_FILE
-        self.core = CoreAddon(self.addon_dir, self.cache_file)
+        # Channels and TV programs are loaded on first use, so navigation
+        # doesn't pay for network I/O
+        self.core = CoreAddon(self.addon_dir, self.cache_file, lazy=True)
 
     def handle_action(self, action: Optional[str]):
         """Handle different actions based on user selection."""
@@ -48,6 +50,10 @@ class KodiAddonWrapper:
             self.update_list()
             self.show_canales()
         elif action == "exportar_m3u":
+            # Only a real list update needs the TV programs; fetch them
+            # concurrently with the channels the export reads in that case
+            if not self.core.load_cache():
+                self.core.load_sources()
             self.update_list()
             self.export_m3u()
         elif action == "play_link":